@@ -6,20 +6,35 @@ Usage:
     python3 load-geojson.py
     PG_HOST=postgis OS_URL=http://opensearch:9200 python3 load-geojson.py
 
-Requires: psycopg2-binary requests pyproj
-    pip install psycopg2-binary requests pyproj
+Requires: psycopg2-binary requests pyproj orjson ijson numpy shapely
+    pip install psycopg2-binary requests pyproj orjson ijson numpy shapely
 """
 
 import copy
-import json
+import io
+import itertools
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import ijson
+import numpy as np
+import orjson
 import psycopg2
 import psycopg2.extras
 import requests
+import requests.adapters
+import shapely
 from pyproj import Transformer
+from urllib3.util import Retry
+
+try:
+    # Optional: JIT-compile the coordinate dedup loop when numba is installed
+    from numba import njit
+except ImportError:
+    njit = None
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DATA_DIR = SCRIPT_DIR / "data"
@@ -27,6 +42,14 @@ DATA_DIR = SCRIPT_DIR / "data"
 # WGS84 -> LV95 transformer (always_xy ensures lon/lat -> E/N order)
 _transformer_4326_to_2056 = Transformer.from_crs(4326, 2056, always_xy=True)
 
+# Features are streamed from disk and flushed in batches of this size,
+# so peak memory stays bounded regardless of file size.
+BATCH_SIZE = 5000
+# How many features of the first batch to sample for schema inference.
+# A column whose value never shows up within the sample stays TEXT, which
+# PostgreSQL accepts for any scalar — safe, just less precisely typed.
+INFER_SAMPLE = 2000
+
 # --- PostGIS settings ---
 PG_HOST = os.environ.get("PG_HOST", "localhost")
 PG_PORT = os.environ.get("PG_PORT", "5432")
@@ -37,25 +60,67 @@ PG_PASSWORD = os.environ.get("PG_PASSWORD", "geo")
 # --- OpenSearch settings ---
 OS_URL = os.environ.get("OS_URL", "http://localhost:9200").rstrip("/")
 
+# Bulk requests are I/O-bound, so several in flight hide the round-trip latency
+OS_BULK_THREADS = min(8, os.cpu_count() or 4)
+_bulk_pool = ThreadPoolExecutor(max_workers=OS_BULK_THREADS)
+
+# One keep-alive session per process: every OpenSearch call reuses pooled
+# TCP connections instead of paying a handshake per request. Whole-request
+# 429/5xx responses are retried with exponential backoff at the transport
+# level; POST is in allowed_methods on purpose since bulk loads are the
+# requests that get throttled.
+SESSION = requests.Session()
+SESSION.mount(OS_URL, requests.adapters.HTTPAdapter(
+    pool_connections=OS_BULK_THREADS, pool_maxsize=OS_BULK_THREADS,
+    max_retries=Retry(
+        total=5, backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"HEAD", "GET", "PUT", "POST", "DELETE"}),
+        respect_retry_after_header=True,
+    ),
+))
+
+# Re-submission attempts for docs individually rejected with 429 inside an
+# otherwise successful _bulk response
+OS_BULK_RETRIES = 5
+
+# Target size of one _bulk request body; small enough to stay under the
+# node's circuit breakers, large enough to amortize the HTTP overhead
+OS_BULK_CHUNK_BYTES = 5 * 1024 * 1024
+
+
+_pg_conn = None
+
 
 def pg_connect():
-    return psycopg2.connect(
-        host=PG_HOST, port=PG_PORT, dbname=PG_DB,
-        user=PG_USER, password=PG_PASSWORD,
-    )
+    """Return this process's cached PostGIS connection (opened on first use).
+
+    Workers process several files each, so reconnecting per file would pay
+    the TCP + auth handshake over and over for nothing.
+    """
+    global _pg_conn
+    if _pg_conn is None or _pg_conn.closed:
+        _pg_conn = psycopg2.connect(
+            host=PG_HOST, port=PG_PORT, dbname=PG_DB,
+            user=PG_USER, password=PG_PASSWORD,
+        )
+    return _pg_conn
+
+
+# Dispatch on type(value): one hash lookup instead of an isinstance chain,
+# and immune to the isinstance(True, int) ordering trap
+_SQL_TYPES = {
+    bool: "BOOLEAN",
+    int: "INTEGER",
+    float: "DOUBLE PRECISION",
+    dict: "JSONB",
+    list: "JSONB",
+}
 
 
 def _sql_type(value):
     """Map a Python/JSON value to a PostgreSQL column type."""
-    if isinstance(value, bool):
-        return "BOOLEAN"
-    if isinstance(value, int):
-        return "INTEGER"
-    if isinstance(value, float):
-        return "DOUBLE PRECISION"
-    if isinstance(value, (dict, list)):
-        return "JSONB"
-    return "TEXT"
+    return _SQL_TYPES.get(type(value), "TEXT")
 
 
 def _infer_columns(features: list[dict]) -> list[tuple[str, str]]:
@@ -65,6 +130,7 @@ def _infer_columns(features: list[dict]) -> list[tuple[str, str]]:
     """
     type_map: dict[str, str] = {}
     seen_keys: list[str] = []
+    unresolved: set[str] = set()  # keys still TEXT for lack of a sample
 
     for feat in features:
         props = feat.get("properties", {})
@@ -72,21 +138,52 @@ def _infer_columns(features: list[dict]) -> list[tuple[str, str]]:
             if k not in type_map:
                 seen_keys.append(k)
                 type_map[k] = "TEXT"  # default
-            if v is not None and type_map[k] == "TEXT":
+                unresolved.add(k)
+            if v is not None and k in unresolved:
                 type_map[k] = _sql_type(v)
+                unresolved.discard(k)
         # Stop scanning once every key has a non-None sample
-        if all(type_map[k] != "TEXT" or k in type_map for k in seen_keys):
-            all_resolved = True
-            for feat2 in features:
-                props2 = feat2.get("properties", {})
-                for k2 in seen_keys:
-                    if type_map[k2] == "TEXT" and props2.get(k2) is not None:
-                        type_map[k2] = _sql_type(props2[k2])
+        if not unresolved:
             break
 
     return [(k, type_map[k]) for k in seen_keys]
 
 
+def _iter_features_seq(f):
+    """Yield features from a GeoJSONSeq/NDJSON stream (one feature per line).
+
+    This is the format ogr2ogr writes with -f GeoJSONSeq; parsing a line at
+    a time with orjson is much cheaper than ijson's event-based parser.
+    Tolerates the RFC 8142 RS (0x1e) prefix some writers emit.
+    """
+    for line in f:
+        line = line.strip(b"\x1e\r\n ")
+        if line:
+            yield orjson.loads(line)
+
+
+def _iter_feature_batches(path: Path, size: int = BATCH_SIZE):
+    """Stream features from a GeoJSON file in fixed-size batches.
+
+    *.geojsonl files are read line by line as GeoJSONSeq; FeatureCollection
+    files go through ijson. Either way only one batch (plus parser state)
+    is in memory at a time.
+    """
+    batch = []
+    with open(path, "rb") as f:
+        if path.suffix == ".geojsonl":
+            feats = _iter_features_seq(f)
+        else:
+            feats = ijson.items(f, "features.item", use_float=True)
+        for feat in feats:
+            batch.append(feat)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
 def _reproject_coords(coords, depth: int = 0):
     """Recursively reproject coordinates from WGS84 to LV95."""
     if depth == 0:
@@ -129,65 +226,143 @@ def _safe_table(name: str) -> str:
     return "geojson_" + name.replace("-", "_")
 
 
-def load_postgis(name: str, features: list[dict], srid: int = 4326) -> tuple[int, bool]:
-    """Load features into PostGIS with flat columns. Returns (row_count, skipped)."""
-    table = _safe_table(name)
-    columns = _infer_columns(features)
+def _copy_escape(value) -> str:
+    """Format a value as a COPY TEXT field (escape backslash/tab/newline, \\N for NULL)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = orjson.dumps(value).decode()
+    elif not isinstance(value, str):
+        value = str(value)
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
 
-    conn = pg_connect()
-    try:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT to_regclass(%s) IS NOT NULL",
-                (f"public.{table}",),
-            )
-            if cur.fetchone()[0]:
-                cur.execute(f"SELECT count(*) FROM {table}")
-                return cur.fetchone()[0], True
-
-            col_defs = ",\n                    ".join(
-                f'"{col}" {sql_type}' for col, sql_type in columns
-            )
-            cur.execute(f"""
-                CREATE TABLE {table} (
-                    gid SERIAL PRIMARY KEY,
-                    {col_defs},
-                    geom GEOMETRY(Geometry, {srid})
-                )
-            """)
-
-            col_names = [f'"{c}"' for c, _ in columns]
-            placeholders = ["%s"] * len(columns) + [
-                f"ST_SetSRID(ST_GeomFromGeoJSON(%s), {srid})"
-            ]
-            insert_sql = (
-                f"INSERT INTO {table} ({', '.join(col_names)}, geom) "
-                f"VALUES ({', '.join(placeholders)})"
-            )
-
-            for feat in features:
-                props = feat.get("properties", {})
-                values = [
-                    psycopg2.extras.Json(v) if isinstance(v, (dict, list)) else v
-                    for v in (props.get(col) for col, _ in columns)
-                ]
-                values.append(json.dumps(feat["geometry"]))
-                cur.execute(insert_sql, values)
-
-            cur.execute(
-                f"CREATE INDEX idx_{table}_geom ON {table} USING GIST (geom)"
-            )
-            conn.commit()
-
-            cur.execute(f"SELECT count(*) FROM {table}")
-            return cur.fetchone()[0], False
-    finally:
-        conn.close()
 
+def _make_row_packer(columns: list[tuple[str, str]]):
+    """Generate a packer turning a properties dict into a tuple of column values.
 
-def _dedup_ring(ring: list) -> list:
-    if not ring:
-        return ring
+    The column list is fixed per dataset, so the per-feature comprehension
+    over it can be specialized away: exec a straight-line tuple constructor
+    with the key names baked in, leaving only K dict probes per feature.
+    """
+    getters = ", ".join(f"props.get({col!r})" for col, _ in columns)
+    comma = "," if len(columns) == 1 else ""
+    code = compile(f"def pack(props): return ({getters}{comma})",
+                   "<row-packer>", "exec")
+    ns: dict = {}
+    exec(code, ns)
+    return ns["pack"]
+
+
+def _insert_execute_values(cur, table: str, columns: list[tuple[str, str]],
+                           features: list[dict], srid: int, pack) -> None:
+    """Insert features with execute_values (one multi-VALUES statement per page).
+
+    Slower than COPY but handles JSONB columns via psycopg2's Json adapter;
+    used when the dataset has columns COPY TEXT can't represent cleanly.
+    """
+    col_names = [f'"{c}"' for c, _ in columns]
+    insert_sql = (
+        f"INSERT INTO {table} ({', '.join(col_names)}, geom) VALUES %s"
+    )
+    template = "({}, ST_SetSRID(ST_GeomFromGeoJSON(%s), {}))".format(
+        ", ".join(["%s"] * len(columns)), srid
+    )
+    rows = (
+        tuple(
+            psycopg2.extras.Json(v) if isinstance(v, (dict, list)) else v
+            for v in pack(feat.get("properties", {}))
+        ) + (orjson.dumps(feat["geometry"]).decode(),)
+        for feat in features
+    )
+    psycopg2.extras.execute_values(
+        cur, insert_sql, rows, template=template, page_size=1000
+    )
+
+
+def _postgis_existing_count(cur, table: str):
+    """Return the row count if `table` already exists, else None."""
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (f"public.{table}",))
+    if not cur.fetchone()[0]:
+        return None
+    cur.execute(f"SELECT count(*) FROM {table}")
+    return cur.fetchone()[0]
+
+
+def _begin_postgis(cur, table: str, columns: list[tuple[str, str]], srid: int) -> bool:
+    """Create the target table. Returns True when batches should use COPY."""
+    col_defs = ",\n            ".join(
+        f'"{col}" {sql_type}' for col, sql_type in columns
+    )
+    cur.execute(f"""
+        CREATE TABLE {table} (
+            gid SERIAL PRIMARY KEY,
+            {col_defs},
+            geom GEOMETRY(Geometry, {srid})
+        )
+    """)
+    # COPY TEXT has no clean adapter for nested JSON values; JSONB datasets
+    # fall back to batched multi-VALUES inserts instead.
+    use_copy = not any(sql_type == "JSONB" for _, sql_type in columns)
+    if use_copy:
+        cur.execute(f"ALTER TABLE {table} ADD COLUMN geom_hex TEXT")
+    return use_copy
+
+
+def _load_postgis_batch(cur, table: str, columns: list[tuple[str, str]],
+                        features: list[dict], srid: int, use_copy: bool,
+                        pack) -> None:
+    """Flush one batch of features into `table`."""
+    if not use_copy:
+        _insert_execute_values(cur, table, columns, features, srid, pack)
+        return
+
+    # Bulk load via COPY into a TEXT staging column. Geometries are parsed
+    # client-side with shapely's vectorized from_geojson and shipped as hex
+    # WKB, so PostGIS only has to decode binary instead of tokenizing
+    # GeoJSON; the conversion to geometry happens once in _finish_postgis.
+    geojson_strs = np.array(
+        [orjson.dumps(feat["geometry"]) for feat in features], dtype=object
+    )
+    wkb_hex = shapely.to_wkb(shapely.from_geojson(geojson_strs), hex=True)
+
+    col_names = [f'"{c}"' for c, _ in columns]
+    buf = io.StringIO()
+    for feat, geom_hex in zip(features, wkb_hex):
+        fields = [_copy_escape(v) for v in pack(feat.get("properties", {}))]
+        fields.append(geom_hex)  # hex digits never need COPY escaping
+        buf.write("\t".join(fields))
+        buf.write("\n")
+    buf.seek(0)
+
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(col_names)}, geom_hex) "
+        f"FROM STDIN WITH (FORMAT text)",
+        buf,
+    )
+
+
+def _finish_postgis(cur, table: str, srid: int, use_copy: bool) -> int:
+    """Convert staged geometries, build the spatial index, return the row count."""
+    if use_copy:
+        cur.execute(f"""
+            UPDATE {table}
+            SET geom = ST_SetSRID(ST_GeomFromWKB(decode(geom_hex, 'hex')), {srid})
+        """)
+        cur.execute(f"ALTER TABLE {table} DROP COLUMN geom_hex")
+    cur.execute(f"CREATE INDEX idx_{table}_geom ON {table} USING GIST (geom)")
+    cur.execute(f"SELECT count(*) FROM {table}")
+    return cur.fetchone()[0]
+
+
+def _dedup_ring_py(ring: list) -> list:
+    """Pure-Python fallback for rings NumPy can't handle (mixed 2D/3D coords)."""
     result = [ring[0]]
     for coord in ring[1:]:
         if coord != result[-1]:
@@ -195,39 +370,98 @@ def _dedup_ring(ring: list) -> list:
     return result
 
 
-def _dedup_coords(geometry: dict) -> dict:
-    """Remove duplicate consecutive coordinates (OpenSearch rejects these)."""
-    geom_type = geometry.get("type", "")
-    coords = geometry.get("coordinates")
-    if coords is None:
-        return geometry
+def _dedup_mask_np(arr):
+    """Boolean mask of coordinates that differ from their predecessor."""
+    keep = np.ones(len(arr), dtype=bool)
+    np.any(arr[1:] != arr[:-1], axis=1, out=keep[1:])
+    return keep
+
+
+if njit is not None:
+    # Single fused pass, no arr[1:] != arr[:-1] temporaries; cache=True so
+    # the compilation cost is paid once across runs.
+    @njit(cache=True)
+    def _dedup_mask(arr):
+        n = arr.shape[0]
+        keep = np.ones(n, dtype=np.bool_)
+        for i in range(1, n):
+            same = True
+            for j in range(arr.shape[1]):
+                if arr[i, j] != arr[i - 1, j]:
+                    same = False
+                    break
+            keep[i] = not same
+        return keep
+else:
+    _dedup_mask = _dedup_mask_np
+
+
+def _dedup_ring(ring: list) -> list:
+    """Drop consecutive duplicate coordinates from a ring.
+
+    Vectorized: one boolean reduction over an (N, 2) float array instead of
+    N Python list comparisons, which dominates CPU time on large polygons.
+    """
+    if len(ring) < 2:
+        return ring
+    try:
+        arr = np.asarray(ring, dtype=np.float64)
+    except ValueError:
+        return _dedup_ring_py(ring)
+    keep = _dedup_mask(arr)
+    if keep.all():
+        return ring
+    return arr[keep].tolist()
 
-    if geom_type == "Polygon":
-        coords = [_dedup_ring(ring) for ring in coords]
-    elif geom_type == "MultiPolygon":
-        coords = [[_dedup_ring(ring) for ring in poly] for poly in coords]
 
-    return {**geometry, "coordinates": coords}
+def _geometry_bytes(geometry: dict):
+    """Serialize a geometry to JSON bytes with duplicate consecutive
+    coordinates removed (OpenSearch rejects these).
+
+    Dedup and serialization are fused: each Polygon/MultiPolygon ring is
+    deduped and written straight into the output, so no deduped copy of the
+    whole geometry is ever materialized.
+    """
+    geom_type = geometry.get("type", "")
+    coords = geometry.get("coordinates")
+    if (geom_type not in ("Polygon", "MultiPolygon") or coords is None
+            or geometry.keys() - {"type", "coordinates"}):
+        return orjson.dumps(geometry)
+
+    out = bytearray()
+    out += b'{"type":"%s","coordinates":[' % geom_type.encode()
+    polys = [coords] if geom_type == "Polygon" else coords
+    for p, poly in enumerate(polys):
+        if p:
+            out += b","
+        if geom_type == "MultiPolygon":
+            out += b"["
+        for r, ring in enumerate(poly):
+            if r:
+                out += b","
+            out += orjson.dumps(_dedup_ring(ring))
+        if geom_type == "MultiPolygon":
+            out += b"]"
+    out += b"]}"
+    return out
+
+
+_OS_FIELD_TYPES = {
+    bool: {"type": "boolean"},
+    int: {"type": "integer"},
+    float: {"type": "float"},
+    str: {"type": "text", "fields": {"raw": {"type": "keyword"}}},
+    dict: {"type": "object", "dynamic": True},
+    list: {"type": "object", "dynamic": True, "enabled": False},
+}
 
 
 def infer_mapping(properties: dict) -> dict:
     """Infer OpenSearch field mappings from a sample feature's properties."""
-    field_defs = {}
-    for k, v in properties.items():
-        if isinstance(v, bool):
-            field_defs[k] = {"type": "boolean"}
-        elif isinstance(v, int):
-            field_defs[k] = {"type": "integer"}
-        elif isinstance(v, float):
-            field_defs[k] = {"type": "float"}
-        elif isinstance(v, str):
-            field_defs[k] = {"type": "text", "fields": {"raw": {"type": "keyword"}}}
-        elif isinstance(v, dict):
-            field_defs[k] = {"type": "object", "dynamic": True}
-        elif isinstance(v, list):
-            field_defs[k] = {"type": "object", "dynamic": True, "enabled": False}
-        else:
-            field_defs[k] = {"type": "keyword"}
+    field_defs = {
+        k: _OS_FIELD_TYPES.get(type(v), {"type": "keyword"})
+        for k, v in properties.items()
+    }
     return {
         "mappings": {
             "properties": {
@@ -240,49 +474,44 @@ def infer_mapping(properties: dict) -> dict:
     }
 
 
-def load_opensearch(name: str, features: list[dict]) -> tuple[int, int, bool]:
-    """Load features into OpenSearch index `geojson-{name}`.
+def _opensearch_existing_count(index: str):
+    """Return the doc count if `index` already exists, else None."""
+    resp = SESSION.head(f"{OS_URL}/{index}", timeout=10)
+    if resp.status_code != 200:
+        return None
+    count_resp = SESSION.get(f"{OS_URL}/{index}/_count", timeout=10)
+    return count_resp.json().get("count", 0)
 
-    Returns (indexed_count, error_count, skipped).
-    """
-    index = f"geojson-{name}"
 
-    if not features:
-        return 0, 0, False
+def _begin_opensearch(index: str, sample_properties: dict) -> None:
+    """Create the index with mappings inferred from a sample feature.
 
-    # Skip if index already exists
-    resp = requests.head(f"{OS_URL}/{index}", timeout=10)
-    if resp.status_code == 200:
-        count_resp = requests.get(f"{OS_URL}/{index}/_count", timeout=10)
-        return count_resp.json().get("count", 0), 0, True
+    Refresh and replication are disabled for the duration of the bulk load;
+    _finish_opensearch restores them once everything is indexed.
+    """
+    body = infer_mapping(sample_properties)
+    body["settings"] = {
+        "index": {
+            "refresh_interval": "-1",
+            "number_of_replicas": 0,
+            "translog.flush_threshold_size": "1gb",
+        }
+    }
+    resp = SESSION.put(f"{OS_URL}/{index}", json=body, timeout=10)
+    resp.raise_for_status()
 
-    for feat in features:
-        feat["geometry"] = _dedup_coords(feat["geometry"])
 
-    resp = requests.put(
-        f"{OS_URL}/{index}",
-        json=infer_mapping(features[0].get("properties", {})),
-        timeout=10,
-    )
-    resp.raise_for_status()
+def _post_bulk(bulk_body) -> int:
+    """POST one NDJSON body to _bulk. Returns the number of rejected docs.
 
-    # Bulk index in batches to avoid 429 Too Many Requests
-    BATCH_SIZE = 500
+    A _bulk response is 200 even when single docs were throttled with a 429
+    by the circuit breaker, so those action/doc line pairs are requeued and
+    re-POSTed with exponential backoff. Whole-request failures are already
+    retried by the session adapter.
+    """
     errors = 0
-    for batch_start in range(0, len(features), BATCH_SIZE):
-        batch = features[batch_start:batch_start + BATCH_SIZE]
-        bulk_lines = []
-        for i, feat in enumerate(batch, start=batch_start + 1):
-            bulk_lines.append(json.dumps({"index": {"_index": index, "_id": str(i)}}))
-            bulk_lines.append(json.dumps({
-                "id": i,
-                "type": "Feature",
-                "properties": feat.get("properties", {}),
-                "geometry": feat.get("geometry"),
-            }))
-        bulk_body = "\n".join(bulk_lines) + "\n"
-
-        resp = requests.post(
+    for attempt in range(OS_BULK_RETRIES):
+        resp = SESSION.post(
             f"{OS_URL}/_bulk",
             headers={"Content-Type": "application/x-ndjson"},
             data=bulk_body,
@@ -291,20 +520,153 @@ def load_opensearch(name: str, features: list[dict]) -> tuple[int, int, bool]:
         resp.raise_for_status()
 
         bulk_result = resp.json()
-        if bulk_result.get("errors"):
-            for item in bulk_result.get("items", []):
-                if item.get("index", {}).get("error"):
-                    errors += 1
+        if not bulk_result.get("errors"):
+            return errors
+
+        lines = bytes(bulk_body).splitlines()
+        retry = bytearray()
+        for j, item in enumerate(bulk_result.get("items", [])):
+            result = item.get("index", {})
+            if result.get("status") == 429:
+                retry += lines[2 * j] + b"\n" + lines[2 * j + 1] + b"\n"
+            elif result.get("error"):
+                errors += 1
+        if not retry:
+            return errors
+        time.sleep(0.5 * 2 ** attempt)
+        bulk_body = retry
+
+    # Out of attempts: whatever is still queued counts as rejected
+    return errors + len(bulk_body.splitlines()) // 2
+
+
+def _load_opensearch_batch(index: str, features: list[dict], start_id: int) -> int:
+    """Bulk index one batch of features. Returns the number of rejected docs.
+
+    The NDJSON body is accumulated in a bytearray and cut into chunks of
+    ~OS_BULK_CHUNK_BYTES, which bounds both the request size (avoiding 429
+    Too Many Requests) and the peak payload memory. Chunks are POSTed
+    concurrently from a thread pool.
+    """
+    bodies = []
+    buf = bytearray()
+    for i, feat in enumerate(features, start=start_id):
+        buf += orjson.dumps({"index": {"_index": index, "_id": str(i)}})
+        buf += b"\n"
+        geometry = feat.get("geometry")
+        buf += b'{"id":%d,"type":"Feature","properties":' % i
+        buf += orjson.dumps(feat.get("properties", {}))
+        buf += b',"geometry":'
+        buf += b"null" if geometry is None else _geometry_bytes(geometry)
+        buf += b"}\n"
+        if len(buf) >= OS_BULK_CHUNK_BYTES:
+            # requests takes the bytearray as-is; no bytes() copy needed
+            bodies.append(buf)
+            buf = bytearray()
+    if buf:
+        bodies.append(buf)
+
+    return sum(_bulk_pool.map(_post_bulk, bodies))
+
+
+def _finish_opensearch(index: str) -> int:
+    """Restore index settings, refresh and return the final doc count."""
+    resp = SESSION.put(
+        f"{OS_URL}/{index}/_settings",
+        json={"index": {"refresh_interval": "1s", "number_of_replicas": 1}},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    SESSION.post(f"{OS_URL}/{index}/_refresh", timeout=10)
+    SESSION.post(
+        f"{OS_URL}/{index}/_forcemerge?max_num_segments=1", timeout=120
+    )
+    count_resp = SESSION.get(f"{OS_URL}/{index}/_count", timeout=10)
+    return count_resp.json().get("count", 0)
 
-    requests.post(f"{OS_URL}/{index}/_refresh", timeout=10)
-    count_resp = requests.get(f"{OS_URL}/{index}/_count", timeout=10)
-    return count_resp.json().get("count", 0), errors, False
+
+def process_file(path: Path, name: str) -> list[str]:
+    """Stream one GeoJSON file into PostGIS (WGS84 + LV95) and OpenSearch.
+
+    Runs in a worker process; returns its report lines instead of printing
+    so the parent can emit them without interleaving.
+    """
+    table = _safe_table(name)
+    lv95_table = _safe_table(f"{name}-lv95")
+    index = f"geojson-{name}"
+
+    conn = pg_connect()
+    try:
+        with conn.cursor() as cur:
+            pg_count = _postgis_existing_count(cur, table)
+            lv95_count = _postgis_existing_count(cur, lv95_table)
+            os_count = _opensearch_existing_count(index)
+
+            load_pg = pg_count is None
+            load_lv95 = lv95_count is None
+            load_os = os_count is None
+
+            if load_pg or load_lv95 or load_os:
+                batches = _iter_feature_batches(path)
+                first = next(batches, None)
+                if first is None:
+                    return [f"  {name}: empty, skipping"]
+
+                columns = _infer_columns(first[:INFER_SAMPLE])
+                pack = _make_row_packer(columns)
+
+                if load_pg:
+                    pg_use_copy = _begin_postgis(cur, table, columns, srid=4326)
+                if load_lv95:
+                    lv95_use_copy = _begin_postgis(cur, lv95_table, columns, srid=2056)
+                if load_os:
+                    _begin_opensearch(index, first[0].get("properties", {}))
+
+                os_errors = 0
+                total = 0
+                for batch in itertools.chain([first], batches):
+                    if load_pg:
+                        _load_postgis_batch(cur, table, columns, batch, 4326,
+                                            pg_use_copy, pack)
+                    if load_os:
+                        os_errors += _load_opensearch_batch(index, batch, total + 1)
+                    if load_lv95:
+                        lv95_batch = _reproject_features(batch)
+                        _load_postgis_batch(cur, lv95_table, columns, lv95_batch,
+                                            2056, lv95_use_copy, pack)
+                    total += len(batch)
+
+                if load_pg:
+                    pg_count = _finish_postgis(cur, table, 4326, pg_use_copy)
+                if load_lv95:
+                    lv95_count = _finish_postgis(cur, lv95_table, 2056, lv95_use_copy)
+                conn.commit()
+                if load_os:
+                    os_count = _finish_opensearch(index)
+
+            lines = [f"  {name} -> PostGIS ({table}): {pg_count} features"
+                     + ("" if load_pg else " (already exists, skipped)")]
+            msg = f"  {name} -> OpenSearch ({index}): {os_count} features"
+            if not load_os:
+                msg += " (already exists, skipped)"
+            elif os_errors:
+                msg += f" ({os_errors} skipped - invalid geometry)"
+            lines.append(msg)
+            lines.append(f"  {name} -> PostGIS LV95 ({lv95_table}): {lv95_count} features"
+                         + ("" if load_lv95 else " (already exists, skipped)"))
+            return lines
+    finally:
+        # Keep the cached connection but leave no transaction (aborted or
+        # otherwise) behind for the worker's next file
+        conn.rollback()
 
 
 def main():
-    geojson_files = sorted(DATA_DIR.glob("*.geojson"))
+    geojson_files = sorted(
+        list(DATA_DIR.glob("*.geojson")) + list(DATA_DIR.glob("*.geojsonl"))
+    )
     if not geojson_files:
-        print(f"No .geojson files found in {DATA_DIR}")
+        print(f"No .geojson/.geojsonl files found in {DATA_DIR}")
         sys.exit(1)
 
     print("=" * 55)
@@ -316,42 +678,18 @@ def main():
     print(f"Files:       {len(geojson_files)}")
     print()
 
-    for path in geojson_files:
-        name = path.stem
-
-        with open(path) as f:
-            fc = json.load(f)
-        features = fc.get("features", [])
-        if not features:
-            print(f"  {name}: empty, skipping")
-            continue
-
-        table = _safe_table(name)
-
-        # PostGIS (WGS84)
-        print(f"  {name} -> PostGIS ({table}) ... ", end="", flush=True)
-        count, skipped = load_postgis(name, features)
-        print(f"{count} features" + (" (already exists, skipped)" if skipped else ""))
-
-        # OpenSearch (WGS84)
-        print(f"  {name} -> OpenSearch (geojson-{name}) ... ", end="", flush=True)
-        indexed, errors, os_skipped = load_opensearch(name, features)
-        msg = f"{indexed} features"
-        if os_skipped:
-            msg += " (already exists, skipped)"
-        elif errors:
-            msg += f" ({errors} skipped - invalid geometry)"
-        print(msg)
-
-        # PostGIS (LV95 / EPSG:2056)
-        lv95_name = f"{name}-lv95"
-        lv95_table = _safe_table(lv95_name)
-        print(f"  {name} -> PostGIS LV95 ({lv95_table}) ... ", end="", flush=True)
-        lv95_features = _reproject_features(features)
-        lv95_count, lv95_skipped = load_postgis(lv95_name, lv95_features, srid=2056)
-        print(f"{lv95_count} features" + (" (already exists, skipped)" if lv95_skipped else ""))
-
-        print()
+    # Datasets are independent, and the dedup/serialization work is
+    # GIL-bound Python, so fan out one worker process per file.
+    workers = min(len(geojson_files), os.cpu_count() or 4)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(process_file, path, path.stem): path.stem
+            for path in geojson_files
+        }
+        for future in as_completed(futures):
+            for line in future.result():
+                print(line)
+            print()
 
     print("Done!")
 